@@ -2,44 +2,80 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime, timedelta
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import timedelta
+from types import MappingProxyType
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
 from .const import (
     DOMAIN,
     DEFAULT_SCAN_INTERVAL,
-    WEEKDAY_SCHEDULE_HIGHER,
-    WEEKDAY_SCHEDULE_LOWER,
-    WEEKEND_HOLIDAY_SCHEDULE_HIGHER,
-    WEEKEND_HOLIDAY_SCHEDULE_LOWER,
+    EVENT_COST_CALCULATED,
+    EVENT_CURRENT_BLOCK,
     CONF_ENERGY_VT_PRICE,
     CONF_ENERGY_MT_PRICE,
-    CONF_BLOCK_1_PRICE,
-    CONF_BLOCK_2_PRICE,
-    CONF_BLOCK_3_PRICE,
-    CONF_BLOCK_4_PRICE,
-    CONF_BLOCK_5_PRICE,
     CONF_CONTRIBUTIONS_PRICE,
     CONF_EXCISE_TAX,
+    BLOCK_PRICE_KEYS,
+    DEFAULT_PRICES,
     BLOCK_DESCRIPTIONS,
+    BLOCK_DESCRIPTIONS_BY_BLOCK,
     ENERGY_DESCRIPTIONS,
-    is_holiday,
-    get_season,
     get_slovenian_holidays_for_year,
-    get_energy_tariff,
     calculate_total_price_per_kwh,
     SEASON_INFO,
+    SEASON_NAME,
+    EMPTY_MAPPING,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.BINARY_SENSOR]
 
+# Payload template for the current block event, with fallbacks for missing data
+_CURRENT_BLOCK_EVENT_DEFAULTS = MappingProxyType({
+    "current_block": 3,
+    "total_price": 0.160000,
+    "energy_tariff": "MT",
+    "energy_price": 0,
+    "network_price": 0,
+    "contributions": 0,
+    "excise_tax": 0,
+    "season": "lower",
+    "is_holiday": False,
+})
+
+# Only five block_states maps are possible, one per active block
+_BLOCK_STATES_BY_CURRENT = {
+    current: MappingProxyType({block: block == current for block in range(1, 6)})
+    for current in range(1, 6)
+}
+
+
+@dataclass(slots=True, frozen=True)
+class PriceConfig:
+    """Configured prices in EUR/kWh, read once from the config entry."""
+
+    energy_vt: float
+    energy_mt: float
+    network_prices: Mapping[int, float]
+    # Both indexed by block number, index 0 unused
+    network_prices_by_block: tuple[float, ...]
+    network_prices_rounded: tuple[float, ...]
+    contributions: float
+    excise_tax: float
+    # Sensor states rounded to 6 decimals; energy is indexed by is_vt (MT, VT)
+    energy_rounded: tuple[float, float]
+    contributions_rounded: float
+    excise_tax_rounded: float
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Slovenian Electricity Costs from a config entry."""
@@ -48,7 +84,17 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     await coordinator.async_config_entry_first_refresh()
 
     hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = coordinator
+    hass.data[DOMAIN][entry.entry_id] = {
+        "coordinator": coordinator,
+        # Shared by every entity of this entry
+        "device_info": MappingProxyType({
+            "identifiers": frozenset({(DOMAIN, entry.entry_id)}),
+            "name": "Slovenian Electricity Costs",
+            "manufacturer": "49jan",
+            "model": "Tariff Calculator",
+            "sw_version": "1.1-b",
+        }),
+    }
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
@@ -59,35 +105,29 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         config_data = dict(entry.data)
         
         # Update prices if provided
-        for block in range(1, 6):
-            price_key = f"block_{block}_price"
+        for price_key in BLOCK_PRICE_KEYS:
             if price_key in data:
-                config_data[f"block_{block}_price"] = data[price_key]
+                config_data[price_key] = data[price_key]
         
         # Update config entry
         hass.config_entries.async_update_entry(entry, data=config_data)
+        coordinator._refresh_price_cache()
         await coordinator.async_request_refresh()
 
     async def get_current_block_service(call):
         """Handle get current block service call."""
         current_data = coordinator.data
         if current_data:
-            current_block = current_data.get("current_block", 3)
-            current_total_price = current_data.get("total_price", 0.160000)
-            
+            payload = {
+                key: current_data.get(key, default)
+                for key, default in _CURRENT_BLOCK_EVENT_DEFAULTS.items()
+            }
+            payload["block_description"] = BLOCK_DESCRIPTIONS.get(
+                payload["current_block"], "Unknown"
+            )
+
             # Fire an event with the current block info
-            hass.bus.async_fire(f"{DOMAIN}_current_block", {
-                "current_block": current_block,
-                "total_price": current_total_price,
-                "energy_tariff": current_data.get("energy_tariff", "MT"),
-                "energy_price": current_data.get("energy_price", 0),
-                "network_price": current_data.get("network_price", 0),
-                "contributions": current_data.get("contributions", 0),
-                "excise_tax": current_data.get("excise_tax", 0),
-                "block_description": BLOCK_DESCRIPTIONS.get(current_block, "Unknown"),
-                "season": current_data.get("season", "lower"),
-                "is_holiday": current_data.get("is_holiday", False),
-            })
+            hass.bus.async_fire(EVENT_CURRENT_BLOCK, payload)
 
     async def calculate_cost_service(call):
         """Handle calculate cost service call."""
@@ -99,7 +139,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             calculated_cost = consumption * current_total_price
             
             # Fire an event with the calculated cost
-            hass.bus.async_fire(f"{DOMAIN}_cost_calculated", {
+            hass.bus.async_fire(EVENT_COST_CALCULATED, {
                 "consumption_kwh": consumption,
                 "total_price_per_kwh": current_total_price,
                 "calculated_cost": calculated_cost,
@@ -131,6 +171,15 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 class SlovenianElectricityCostsCoordinator(DataUpdateCoordinator):
     """Class to manage electricity cost calculations and data updates."""
 
+    __slots__ = (
+        "entry",
+        "hass",
+        "_pc",
+        "_last_minute_key",
+        "_last_signature",
+        "_cached_result",
+    )
+
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
         """Initialize."""
         super().__init__(
@@ -141,6 +190,49 @@ class SlovenianElectricityCostsCoordinator(DataUpdateCoordinator):
         )
         self.entry = entry
         self.hass = hass
+        self._last_minute_key: tuple[int, ...] | None = None
+        self._last_signature: tuple[Any, ...] | None = None
+        self._cached_result: dict[str, Any] | None = None
+        self._pc = self._build_price_config()
+
+    def _build_price_config(self) -> PriceConfig:
+        """Read configured prices from the config entry."""
+        data = self.entry.data
+        energy_vt = data.get(CONF_ENERGY_VT_PRICE, DEFAULT_PRICES[CONF_ENERGY_VT_PRICE])
+        energy_mt = data.get(CONF_ENERGY_MT_PRICE, DEFAULT_PRICES[CONF_ENERGY_MT_PRICE])
+        contributions = data.get(
+            CONF_CONTRIBUTIONS_PRICE, DEFAULT_PRICES[CONF_CONTRIBUTIONS_PRICE]
+        )
+        excise_tax = data.get(CONF_EXCISE_TAX, DEFAULT_PRICES[CONF_EXCISE_TAX])
+        network_prices = {
+            block: data.get(key, DEFAULT_PRICES[key])
+            for block, key in enumerate(BLOCK_PRICE_KEYS, start=1)
+        }
+        return PriceConfig(
+            energy_vt=energy_vt,
+            energy_mt=energy_mt,
+            network_prices=MappingProxyType(network_prices),
+            network_prices_by_block=(
+                0.0,
+                *(network_prices[block] for block in range(1, 6)),
+            ),
+            network_prices_rounded=(
+                0.0,
+                *(round(network_prices[block], 6) for block in range(1, 6)),
+            ),
+            contributions=contributions,
+            excise_tax=excise_tax,
+            energy_rounded=(round(energy_mt, 6), round(energy_vt, 6)),
+            contributions_rounded=round(contributions, 6),
+            excise_tax_rounded=round(excise_tax, 6),
+        )
+
+    def _refresh_price_cache(self) -> None:
+        """Re-read configured prices after the config entry changed."""
+        self._pc = self._build_price_config()
+        # Prices changed, so the memoized result for this minute is stale
+        self._last_minute_key = None
+        self._last_signature = None
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Update data via library."""
@@ -151,95 +243,84 @@ class SlovenianElectricityCostsCoordinator(DataUpdateCoordinator):
 
     async def _get_current_data(self) -> dict[str, Any]:
         """Get current tariff data."""
-        now = datetime.now()
-        season = get_season(now)
-        is_holiday_today = is_holiday(now)
-        
+        now = dt_util.now()
+        minute_key = (now.year, now.month, now.day, now.weekday(), now.hour * 60 + now.minute)
+        if minute_key == self._last_minute_key:
+            return self._cached_result
+
         # Get prices from configuration
-        energy_vt_price = self.entry.data.get(CONF_ENERGY_VT_PRICE, 0.1199)
-        energy_mt_price = self.entry.data.get(CONF_ENERGY_MT_PRICE, 0.0979)
-        
-        network_prices = {
-            1: self.entry.data.get(CONF_BLOCK_1_PRICE, 0.01998),
-            2: self.entry.data.get(CONF_BLOCK_2_PRICE, 0.01833),
-            3: self.entry.data.get(CONF_BLOCK_3_PRICE, 0.018090),
-            4: self.entry.data.get(CONF_BLOCK_4_PRICE, 0.018550),
-            5: self.entry.data.get(CONF_BLOCK_5_PRICE, 0.018730),
-        }
-        
-        contributions = self.entry.data.get(CONF_CONTRIBUTIONS_PRICE, 0.000930)
-        excise_tax = self.entry.data.get(CONF_EXCISE_TAX, 0.001530)
-        
-        # Calculate total pricing
+        pc = self._pc
+
+        # Season, holiday, block, tariff and total all come from const, which
+        # resolves each of them once
         pricing_info = calculate_total_price_per_kwh(
-            now, energy_vt_price, energy_mt_price, network_prices, contributions, excise_tax
+            now,
+            pc.energy_vt,
+            pc.energy_mt,
+            pc.network_prices_by_block,
+            pc.contributions,
+            pc.excise_tax,
         )
+        season = pricing_info.season
+        is_holiday_today = pricing_info.is_holiday
+        current_block = pricing_info.current_block
+        energy_tariff = pricing_info.energy_tariff
+        is_vt = energy_tariff == "VT"
+
+        # Hand back the previous result while nothing it reports has changed,
+        # so entities that compare results by identity skip their state writes
+        signature = (pc, now.year, season, is_holiday_today, current_block, is_vt)
+        if signature == self._last_signature:
+            self._last_minute_key = minute_key
+            return self._cached_result
 
-        return {
-            "current_block": pricing_info["current_block"],
-            "energy_tariff": pricing_info["energy_tariff"],
-            "energy_price": pricing_info["energy_price"],
-            "network_price": pricing_info["network_price"],
-            "contributions": pricing_info["contributions"],
-            "excise_tax": pricing_info["excise_tax"],
-            "total_price": pricing_info["total_price"],
-            "network_prices": network_prices,
-            "energy_vt_price": energy_vt_price,
-            "energy_mt_price": energy_mt_price,
-            "block_states": {i: i == pricing_info["current_block"] for i in range(1, 6)},
+        total_price = pricing_info.total_price
+        self._cached_result = {
+            "current_block": current_block,
+            "block_description": BLOCK_DESCRIPTIONS_BY_BLOCK[current_block],
+            "energy_tariff": energy_tariff,
+            "energy_tariff_description": ENERGY_DESCRIPTIONS[energy_tariff],
+            "energy_price": pricing_info.energy_price,
+            "network_price": pricing_info.network_price,
+            "contributions": pricing_info.contributions,
+            "excise_tax": pricing_info.excise_tax,
+            "total_price": total_price,
+            "network_prices": pc.network_prices,
+            # Sensor states, rounded here rather than on every read; only the
+            # total varies with time, the rest is rounded with the price config
+            "total_price_rounded": round(total_price, 6),
+            "energy_price_rounded": pc.energy_rounded[is_vt],
+            "network_price_rounded": pc.network_prices_rounded[current_block],
+            "contributions_rounded": pc.contributions_rounded,
+            "excise_tax_rounded": pc.excise_tax_rounded,
+            "network_prices_rounded": pc.network_prices_rounded,
+            "energy_vt_price": pc.energy_vt,
+            "energy_mt_price": pc.energy_mt,
+            "block_states": _BLOCK_STATES_BY_CURRENT[current_block],
             "season": season,
-            "season_info": SEASON_INFO.get(season, {}),
+            "season_info": SEASON_INFO.get(season, EMPTY_MAPPING),
+            "season_name": SEASON_NAME.get(season, "Unknown"),
             "is_holiday": is_holiday_today,
-            "holidays_this_year": get_slovenian_holidays_for_year(now.year),
             "last_updated": now.isoformat(),
         }
+        self._last_minute_key = minute_key
+        self._last_signature = signature
+        return self._cached_result
 
-    def _get_current_tariff_block(self, dt: datetime) -> int:
-        """Determine the current tariff block based on date, time, and season."""
-        season = get_season(dt)
-        is_holiday_today = is_holiday(dt)
-        
-        # Check if it's a holiday or Sunday
-        if is_holiday_today or dt.weekday() == 6:  # Sunday
-            if season == "higher":
-                schedule = SUNDAY_HOLIDAY_SCHEDULE_HIGHER
-            else:
-                schedule = SUNDAY_HOLIDAY_SCHEDULE_LOWER
-        elif dt.weekday() == 5:  # Saturday
-            if season == "higher":
-                schedule = SATURDAY_SCHEDULE_HIGHER
-            else:
-                schedule = SATURDAY_SCHEDULE_LOWER
-        else:  # Monday to Friday
-            if season == "higher":
-                schedule = WEEKDAY_SCHEDULE_HIGHER
-            else:
-                schedule = WEEKDAY_SCHEDULE_LOWER
-
-        # Get current time in HH:MM format
-        current_time = dt.strftime("%H:%M")
-        
-        # Find the appropriate block
-        for slot in schedule:
-            start_time = slot["start"]
-            end_time = slot["end"]
-            
-            # Handle midnight crossing
-            if end_time == "24:00":
-                end_time = "23:59"
-            
-            if start_time <= current_time <= end_time:
-                return slot["block"]
-        
-        # Fallback to block 3 if no match found
-        return 3
+    def get_holidays_this_year(self) -> tuple[str, ...]:
+        """Get this year's holidays in MM-DD format."""
+        # Derived from const's cached holiday set so invalidation covers it
+        return tuple(
+            f"{month:02d}-{day:02d}"
+            for month, day in sorted(get_slovenian_holidays_for_year(dt_util.now().year))
+        )
 
     def get_price_for_block(self, block: int) -> float:
         """Get network price for specific block."""
         if self.data is None:
             return 0.0183  # Default network price
         
-        return self.data.get("network_prices", {}).get(block, 0.0183)
+        return self.data.get("network_prices", EMPTY_MAPPING).get(block, 0.0183)
 
     def get_current_block(self) -> int:
         """Get current tariff block."""
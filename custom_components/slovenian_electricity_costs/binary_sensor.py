@@ -2,6 +2,8 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
 from typing import Any
 
 from homeassistant.components.binary_sensor import (
@@ -12,292 +14,192 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, BLOCK_DESCRIPTIONS, SEASON_INFO
+from .const import (
+    DOMAIN,
+    BLOCK_DESCRIPTIONS_BY_BLOCK,
+    EMPTY_MAPPING,
+    SEASON_MONTHS,
+    SEASON_DESCRIPTION,
+)
+from .entity import SlovenianElectricityCostsEntity
 
 _LOGGER = logging.getLogger(__name__)
 
 
-async def async_setup_entry(
-    hass: HomeAssistant,
-    config_entry: ConfigEntry,
-    async_add_entities: AddEntitiesCallback,
-) -> None:
-    """Set up the binary sensor platform."""
-    coordinator = hass.data[DOMAIN][config_entry.entry_id]
-
-    # Create binary sensors for each tariff block
-    entities = []
-    for block in range(1, 6):
-        entities.append(TariffBlockBinarySensor(coordinator, config_entry, block))
+@dataclass(frozen=True, slots=True)
+class _BinDesc:
+    """Describe a binary sensor in terms of the coordinator data."""
 
-    # Add season and holiday binary sensors
-    entities.append(HigherSeasonBinarySensor(coordinator, config_entry))
-    entities.append(HolidayBinarySensor(coordinator, config_entry))
-    entities.append(CheapElectricityBinarySensor(coordinator, config_entry))
-    entities.append(ExpensiveElectricityBinarySensor(coordinator, config_entry))
+    key: str
+    name: str
+    icon: str
+    is_on: Callable[[dict[str, Any]], bool | None]
+    # Called with (coordinator, coordinator.data)
+    attrs: Callable[[Any, dict[str, Any]], dict[str, Any]]
 
-    async_add_entities(entities)
 
+# Icon per tariff block, indexed by block number
+_BLOCK_ICONS = (
+    None,
+    "mdi:weather-night",  # Very low rate (night)
+    "mdi:weather-sunset-down",  # Low rate
+    "mdi:weather-cloudy",  # Medium rate
+    "mdi:weather-sunny",  # High rate (peak)
+    "mdi:fire",  # Very high rate (special peak)
+)
 
-class TariffBlockBinarySensor(CoordinatorEntity, BinarySensorEntity):
-    """Binary sensor for tariff block state."""
 
-    def __init__(self, coordinator, config_entry: ConfigEntry, block: int) -> None:
-        """Initialize the binary sensor."""
-        super().__init__(coordinator)
-        self._config_entry = config_entry
-        self._block = block
-        self._attr_unique_id = f"{config_entry.entry_id}_electricity_block_{block}_active"
-        self._attr_name = f"Electricity Block {block} Active"
-        self._attr_has_entity_name = True
-        
-        # Set icon based on block
-        if block == 1:
-            self._attr_icon = "mdi:weather-night"  # Very low rate (night)
-        elif block == 2:
-            self._attr_icon = "mdi:weather-sunset-down"  # Low rate
-        elif block == 3:
-            self._attr_icon = "mdi:weather-cloudy"  # Medium rate
-        elif block == 4:
-            self._attr_icon = "mdi:weather-sunny"  # High rate (peak)
-        else:  # block == 5
-            self._attr_icon = "mdi:fire"  # Very high rate (special peak)
+def _block_attrs(block: int) -> Callable[[Any, dict[str, Any]], dict[str, Any]]:
+    """Return the attribute builder for a tariff block sensor."""
 
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device information."""
-        return {
-            "identifiers": {(DOMAIN, self._config_entry.entry_id)},
-            "name": "Slovenian Electricity Costs",
-            "manufacturer": "49jan",
-            "model": "Tariff Calculator",
-            "sw_version": "1.1-b",
+    def attrs(coordinator, data: dict[str, Any]) -> dict[str, Any]:
+        result = {
+            "block": block,
+            "description": BLOCK_DESCRIPTIONS_BY_BLOCK[block],
+            "price": data.get("network_prices", EMPTY_MAPPING).get(block, 0),
+            "is_current_block": data.get("current_block") == block,
+            "season": data.get("season", "lower"),
+            "season_name": data.get("season_name", "Unknown"),
+            "last_updated": data.get("last_updated"),
         }
 
-    @property
-    def is_on(self) -> bool | None:
-        """Return true if the tariff block is active."""
-        if self.coordinator.data is None:
-            return None
-        
-        block_states = self.coordinator.data.get("block_states", {})
-        return block_states.get(self._block, False)
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return extra state attributes."""
-        if self.coordinator.data is None:
-            return {}
-
-        prices = self.coordinator.data.get("prices", {})
-        current_block = self.coordinator.data.get("current_block")
-        season = self.coordinator.data.get("season", "lower")
-        
-        attrs = {
-            "block": self._block,
-            "description": BLOCK_DESCRIPTIONS.get(self._block, "Unknown"),
-            "price": prices.get(self._block, 0),
-            "is_current_block": current_block == self._block,
-            "season": season,
-            "season_name": SEASON_INFO.get(season, {}).get("name", "Unknown"),
-            "last_updated": self.coordinator.data.get("last_updated"),
-        }
-        
         # Add special note for block 5
-        if self._block == 5:
-            attrs["season_note"] = "Block 5 is only used in higher season (Oct-Mar)"
-            
-        return attrs
+        if block == 5:
+            result["season_note"] = "Block 5 is only used in higher season (Oct-Mar)"
 
+        return result
 
-class HigherSeasonBinarySensor(CoordinatorEntity, BinarySensorEntity):
-    """Binary sensor for higher season status."""
+    return attrs
 
-    def __init__(self, coordinator, config_entry: ConfigEntry) -> None:
-        """Initialize the binary sensor."""
-        super().__init__(coordinator)
-        self._config_entry = config_entry
-        self._attr_unique_id = f"{config_entry.entry_id}_electricity_higher_season"
-        self._attr_name = "Electricity Higher Season"
-        self._attr_has_entity_name = True
-        self._attr_icon = "mdi:snowflake"
 
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device information."""
-        return {
-            "identifiers": {(DOMAIN, self._config_entry.entry_id)},
-            "name": "Slovenian Electricity Costs",
-            "manufacturer": "49jan",
-            "model": "Tariff Calculator",
-            "sw_version": "1.1-b",
-        }
+def _season_attrs(coordinator, data: dict[str, Any]) -> dict[str, Any]:
+    """Return attributes for the higher season sensor."""
+    season = data.get("season", "lower")
 
-    @property
-    def is_on(self) -> bool | None:
-        """Return true if it's higher season."""
-        if self.coordinator.data is None:
-            return None
-        
-        season = self.coordinator.data.get("season", "lower")
-        return season == "higher"
+    return {
+        "season": season,
+        "season_name": data.get("season_name", "Unknown"),
+        "months": SEASON_MONTHS.get(season, "Unknown"),
+        "description": SEASON_DESCRIPTION.get(season, "Unknown"),
+        "last_updated": data.get("last_updated"),
+    }
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return extra state attributes."""
-        if self.coordinator.data is None:
-            return {}
-
-        season = self.coordinator.data.get("season", "lower")
-        season_info = SEASON_INFO.get(season, {})
-        
-        return {
-            "season": season,
-            "season_name": season_info.get("name", "Unknown"),
-            "months": season_info.get("months", "Unknown"),
-            "description": season_info.get("description", "Unknown"),
-            "last_updated": self.coordinator.data.get("last_updated"),
-        }
 
+def _holiday_attrs(coordinator, data: dict[str, Any]) -> dict[str, Any]:
+    """Return attributes for the holiday sensor."""
+    return {
+        "holidays_this_year": coordinator.get_holidays_this_year(),
+        "last_updated": data.get("last_updated"),
+    }
 
-class HolidayBinarySensor(CoordinatorEntity, BinarySensorEntity):
-    """Binary sensor for holiday status."""
 
-    def __init__(self, coordinator, config_entry: ConfigEntry) -> None:
-        """Initialize the binary sensor."""
-        super().__init__(coordinator)
-        self._config_entry = config_entry
-        self._attr_unique_id = f"{config_entry.entry_id}_electricity_holiday_today"
-        self._attr_name = "Electricity Holiday Today"
-        self._attr_has_entity_name = True
-        self._attr_icon = "mdi:calendar-star"
+def _rate_attrs(key: str, blocks: list[int]) -> Callable[[Any, dict[str, Any]], dict[str, Any]]:
+    """Return the attribute builder for a cheap/expensive rate sensor."""
 
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device information."""
+    def attrs(coordinator, data: dict[str, Any]) -> dict[str, Any]:
         return {
-            "identifiers": {(DOMAIN, self._config_entry.entry_id)},
-            "name": "Slovenian Electricity Costs",
-            "manufacturer": "49jan",
-            "model": "Tariff Calculator",
-            "sw_version": "1.1-b",
+            "current_block": data.get("current_block", 3),
+            "current_price": data.get("total_price", 0),
+            key: blocks,
+            "last_updated": data.get("last_updated"),
         }
 
-    @property
-    def is_on(self) -> bool | None:
-        """Return true if today is a holiday."""
-        if self.coordinator.data is None:
-            return None
-        
-        return self.coordinator.data.get("is_holiday", False)
+    return attrs
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return extra state attributes."""
-        if self.coordinator.data is None:
-            return {}
-        
-        return {
-            "holidays_this_year": self.coordinator.data.get("holidays_this_year", []),
-            "last_updated": self.coordinator.data.get("last_updated"),
-        }
 
+_BLOCK_DESCS = tuple(
+    _BinDesc(
+        key=f"block_{block}_active",
+        name=f"Electricity Block {block} Active",
+        icon=_BLOCK_ICONS[block],
+        is_on=lambda data, b=block: data.get("block_states", EMPTY_MAPPING).get(b, False),
+        attrs=_block_attrs(block),
+    )
+    for block in range(1, 6)
+)
 
-class CheapElectricityBinarySensor(CoordinatorEntity, BinarySensorEntity):
-    """Binary sensor for cheap electricity periods (blocks 1-2)."""
+_STATUS_DESCS = (
+    _BinDesc(
+        key="higher_season",
+        name="Electricity Higher Season",
+        icon="mdi:snowflake",
+        is_on=lambda data: data.get("season", "lower") == "higher",
+        attrs=_season_attrs,
+    ),
+    _BinDesc(
+        key="holiday_today",
+        name="Electricity Holiday Today",
+        icon="mdi:calendar-star",
+        is_on=lambda data: data.get("is_holiday", False),
+        attrs=_holiday_attrs,
+    ),
+    _BinDesc(
+        key="cheap_rate",
+        name="Electricity Cheap Rate",
+        icon="mdi:currency-eur-off",
+        is_on=lambda data: data.get("current_block", 3) in [1, 2],
+        attrs=_rate_attrs("cheap_blocks", [1, 2]),
+    ),
+    _BinDesc(
+        key="expensive_rate",
+        name="Electricity Expensive Rate",
+        icon="mdi:currency-eur",
+        is_on=lambda data: data.get("current_block", 3) in [4, 5],
+        attrs=_rate_attrs("expensive_blocks", [4, 5]),
+    ),
+)
 
-    def __init__(self, coordinator, config_entry: ConfigEntry) -> None:
-        """Initialize the binary sensor."""
-        super().__init__(coordinator)
-        self._config_entry = config_entry
-        self._attr_unique_id = f"{config_entry.entry_id}_electricity_cheap_rate"
-        self._attr_name = "Electricity Cheap Rate"
-        self._attr_has_entity_name = True
-        self._attr_icon = "mdi:currency-eur-off"
 
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device information."""
-        return {
-            "identifiers": {(DOMAIN, self._config_entry.entry_id)},
-            "name": "Slovenian Electricity Costs",
-            "manufacturer": "49jan",
-            "model": "Tariff Calculator",
-            "sw_version": "1.1-b",
-        }
+async def async_setup_entry(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the binary sensor platform."""
+    entry_data = hass.data[DOMAIN][config_entry.entry_id]
+    coordinator = entry_data["coordinator"]
+    device_info = entry_data["device_info"]
 
-    @property
-    def is_on(self) -> bool | None:
-        """Return true if current tariff is cheap (blocks 1-2)."""
-        if self.coordinator.data is None:
-            return None
-        
-        current_block = self.coordinator.data.get("current_block", 3)
-        return current_block in [1, 2]
+    # Binary sensors for each tariff block, then season/holiday/rate sensors
+    async_add_entities(
+        SlovenianElectricityCostsBinarySensor(coordinator, config_entry, device_info, desc)
+        for desc in (*_BLOCK_DESCS, *_STATUS_DESCS)
+    )
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return extra state attributes."""
-        if self.coordinator.data is None:
-            return {}
-
-        current_block = self.coordinator.data.get("current_block", 3)
-        current_price = self.coordinator.data.get("current_price", 0)
-        
-        return {
-            "current_block": current_block,
-            "current_price": current_price,
-            "cheap_blocks": [1, 2],
-            "last_updated": self.coordinator.data.get("last_updated"),
-        }
 
+class SlovenianElectricityCostsBinarySensor(SlovenianElectricityCostsEntity, BinarySensorEntity):
+    """Binary sensor driven by a _BinDesc description."""
 
-class ExpensiveElectricityBinarySensor(CoordinatorEntity, BinarySensorEntity):
-    """Binary sensor for expensive electricity periods (blocks 4-5)."""
+    __slots__ = ("_desc",)
 
-    def __init__(self, coordinator, config_entry: ConfigEntry) -> None:
+    def __init__(
+        self,
+        coordinator,
+        config_entry: ConfigEntry,
+        device_info: Mapping[str, Any],
+        desc: _BinDesc,
+    ) -> None:
         """Initialize the binary sensor."""
-        super().__init__(coordinator)
-        self._config_entry = config_entry
-        self._attr_unique_id = f"{config_entry.entry_id}_electricity_expensive_rate"
-        self._attr_name = "Electricity Expensive Rate"
-        self._attr_has_entity_name = True
-        self._attr_icon = "mdi:currency-eur"
+        super().__init__(coordinator, device_info)
+        self._desc = desc
+        self._attr_unique_id = f"{config_entry.entry_id}_electricity_{desc.key}"
+        self._attr_name = desc.name
+        self._attr_icon = desc.icon
 
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device information."""
-        return {
-            "identifiers": {(DOMAIN, self._config_entry.entry_id)},
-            "name": "Slovenian Electricity Costs",
-            "manufacturer": "49jan",
-            "model": "Tariff Calculator",
-            "sw_version": "1.1-b",
-        }
+    def _shown_value(self) -> bool | None:
+        """Return the on/off value a write would report."""
+        return self.is_on
+
+    def _build_attrs(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Return the described attributes for a coordinator result."""
+        return self._desc.attrs(self.coordinator, data)
 
     @property
     def is_on(self) -> bool | None:
-        """Return true if current tariff is expensive (blocks 4-5)."""
-        if self.coordinator.data is None:
+        """Return true if the described condition holds."""
+        data = self.coordinator.data
+        if data is None:
             return None
-        
-        current_block = self.coordinator.data.get("current_block", 3)
-        return current_block in [4, 5]
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return extra state attributes."""
-        if self.coordinator.data is None:
-            return {}
-
-        current_block = self.coordinator.data.get("current_block", 3)
-        current_price = self.coordinator.data.get("current_price", 0)
-        
-        return {
-            "current_block": current_block,
-            "current_price": current_price,
-            "expensive_blocks": [4, 5],
-            "last_updated": self.coordinator.data.get("last_updated"),
-        }
\ No newline at end of file
+        return self._desc.is_on(data)
@@ -2,14 +2,22 @@
 from __future__ import annotations
 
 import logging
+import re
+from collections.abc import Mapping
 from typing import Any
+from weakref import WeakKeyDictionary
 
 import voluptuous as vol
 
 from homeassistant import config_entries
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers import selector
-from homeassistant.helpers.entity_registry import async_get as async_get_entity_registry
+from homeassistant.helpers.entity_registry import (
+    EVENT_ENTITY_REGISTRY_UPDATED,
+    EntityRegistry,
+    async_get as async_get_entity_registry,
+)
 
 from .const import (
     DOMAIN,
@@ -19,13 +27,9 @@ from .const import (
     CONF_CONSUMPTION_SENSOR,
     CONF_ENERGY_VT_PRICE,
     CONF_ENERGY_MT_PRICE,
-    CONF_BLOCK_1_PRICE,
-    CONF_BLOCK_2_PRICE,
-    CONF_BLOCK_3_PRICE,
-    CONF_BLOCK_4_PRICE,
-    CONF_BLOCK_5_PRICE,
     CONF_CONTRIBUTIONS_PRICE,
     CONF_EXCISE_TAX,
+    BLOCK_PRICE_KEYS,
     DEFAULT_PRICES,
     DEFAULT_AUTO_UPDATE,
     BLOCK_DESCRIPTIONS,
@@ -34,6 +38,96 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+_ENERGY_SENSOR_RE = re.compile(r"energy|consumption|power|electricity", re.IGNORECASE)
+
+# Candidate consumption sensors per entity registry, dropped on registry changes
+_ENERGY_SENSOR_CACHE: WeakKeyDictionary[EntityRegistry, list[str]] = WeakKeyDictionary()
+
+
+@callback
+def _get_energy_sensors(hass: HomeAssistant) -> list[str]:
+    """Return sensor entity IDs that look like energy/consumption sensors."""
+    entity_registry = async_get_entity_registry(hass)
+    energy_sensors = _ENERGY_SENSOR_CACHE.get(entity_registry)
+    if energy_sensors is not None:
+        return energy_sensors
+
+    energy_sensors = [
+        entity_id
+        for entity in entity_registry.entities.values()
+        if (entity_id := entity.entity_id).startswith("sensor.")
+        and _ENERGY_SENSOR_RE.search(entity_id)
+    ]
+    _ENERGY_SENSOR_CACHE[entity_registry] = energy_sensors
+
+    @callback
+    def _invalidate(event: Event) -> None:
+        """Forget the cached list once the registry changes."""
+        _ENERGY_SENSOR_CACHE.pop(entity_registry, None)
+
+    hass.bus.async_listen_once(EVENT_ENTITY_REGISTRY_UPDATED, _invalidate)
+    return energy_sensors
+
+
+_SUPPLIER_SELECTOR = selector.SelectSelector(
+    selector.SelectSelectorConfig(
+        options=[
+            {"value": key, "label": value}
+            for key, value in SUPPLIERS.items()
+        ],
+        mode=selector.SelectSelectorMode.DROPDOWN,
+    )
+)
+
+_EUR_KWH = {"suffix": "€/kWh"}
+_PRICE_VALIDATOR = vol.All(vol.Coerce(float), vol.Range(min=0, max=1))
+
+# Every price field in form order; the network block prices are also the
+# fields offered in the options flow
+_ALL_PRICE_KEYS = (
+    CONF_ENERGY_VT_PRICE,
+    CONF_ENERGY_MT_PRICE,
+    *BLOCK_PRICE_KEYS,
+    CONF_CONTRIBUTIONS_PRICE,
+    CONF_EXCISE_TAX,
+)
+
+# Price configuration schema with all components
+_PRICES_SCHEMA = vol.Schema(
+    {
+        vol.Required(
+            key, default=DEFAULT_PRICES[key], description=_EUR_KWH
+        ): _PRICE_VALIDATOR
+        for key in _ALL_PRICE_KEYS
+    }
+)
+
+# Static text for the prices step; only the supplier is filled in per flow
+_PRICES_PLACEHOLDERS_BASE = {
+    "energy_vt_desc": ENERGY_DESCRIPTIONS["VT"],
+    "energy_mt_desc": ENERGY_DESCRIPTIONS["MT"],
+    **{f"block_{block}_desc": BLOCK_DESCRIPTIONS[block] for block in range(1, 6)},
+    "contributions_info": "Prispevki (RES, OVES, EKO sklad, itd.)",
+    "excise_info": "Trošarina na električno energijo",
+}
+
+
+def _options_schema(data: Mapping[str, Any]) -> vol.Schema:
+    """Build the options schema with the entry's current values as defaults."""
+    schema: dict[Any, Any] = {
+        vol.Optional(
+            CONF_AUTO_UPDATE,
+            default=data.get(CONF_AUTO_UPDATE, DEFAULT_AUTO_UPDATE),
+        ): bool,
+    }
+    for key in BLOCK_PRICE_KEYS:
+        schema[
+            vol.Optional(
+                key, default=data.get(key, DEFAULT_PRICES[key]), description=_EUR_KWH
+            )
+        ] = _PRICE_VALIDATOR
+    return vol.Schema(schema)
+
 
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Slovenian Electricity Costs."""
@@ -60,30 +154,11 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             return await self.async_step_prices()
 
         # Get available energy sensors for consumption
-        entity_registry = async_get_entity_registry(self.hass)
-        energy_sensors = [
-            entity.entity_id
-            for entity in entity_registry.entities.values()
-            if entity.entity_id.startswith("sensor.")
-            and (
-                "energy" in entity.entity_id.lower()
-                or "consumption" in entity.entity_id.lower()
-                or "power" in entity.entity_id.lower()
-                or "electricity" in entity.entity_id.lower()
-            )
-        ]
+        energy_sensors = _get_energy_sensors(self.hass)
 
         data_schema = vol.Schema(
             {
-                vol.Required(CONF_SUPPLIER): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=[
-                            {"value": key, "label": value}
-                            for key, value in SUPPLIERS.items()
-                        ],
-                        mode=selector.SelectSelectorMode.DROPDOWN,
-                    )
-                ),
+                vol.Required(CONF_SUPPLIER): _SUPPLIER_SELECTOR,
                 vol.Optional(CONF_CONSUMPTION_SENSOR): selector.EntitySelector(
                     selector.EntitySelectorConfig(
                         include_entities=energy_sensors,
@@ -107,27 +182,19 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         errors: dict[str, str] = {}
 
         if user_input is not None:
-            # Validate prices
-            for block in range(1, 6):
-                price_key = f"block_{block}_price"
-                if user_input.get(price_key, 0) <= 0:
-                    errors[price_key] = "invalid_price"
+            # Network block prices must be strictly positive
+            for key in BLOCK_PRICE_KEYS:
+                if user_input[key] <= 0:
+                    errors[key] = "invalid_price"
 
             if not errors:
                 # Combine all configuration data
                 config_data = {
                     CONF_SUPPLIER: self._supplier,
                     CONF_AUTO_UPDATE: self._auto_update,
-                    CONF_ENERGY_VT_PRICE: user_input[CONF_ENERGY_VT_PRICE],
-                    CONF_ENERGY_MT_PRICE: user_input[CONF_ENERGY_MT_PRICE],
-                    CONF_BLOCK_1_PRICE: user_input[CONF_BLOCK_1_PRICE],
-                    CONF_BLOCK_2_PRICE: user_input[CONF_BLOCK_2_PRICE],
-                    CONF_BLOCK_3_PRICE: user_input[CONF_BLOCK_3_PRICE],
-                    CONF_BLOCK_4_PRICE: user_input[CONF_BLOCK_4_PRICE],
-                    CONF_BLOCK_5_PRICE: user_input[CONF_BLOCK_5_PRICE],
-                    CONF_CONTRIBUTIONS_PRICE: user_input[CONF_CONTRIBUTIONS_PRICE],
-                    CONF_EXCISE_TAX: user_input[CONF_EXCISE_TAX],
                 }
+                for key in _ALL_PRICE_KEYS:
+                    config_data[key] = user_input[key]
 
                 if self._consumption_sensor:
                     config_data[CONF_CONSUMPTION_SENSOR] = self._consumption_sensor
@@ -141,72 +208,13 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     data=config_data,
                 )
 
-        # Price configuration schema with all components
-        data_schema = vol.Schema(
-            {
-                vol.Required(
-                    CONF_ENERGY_VT_PRICE,
-                    default=DEFAULT_PRICES[CONF_ENERGY_VT_PRICE],
-                    description={"suffix": "€/kWh"},
-                ): vol.All(vol.Coerce(float), vol.Range(min=0, max=1)),
-                vol.Required(
-                    CONF_ENERGY_MT_PRICE,
-                    default=DEFAULT_PRICES[CONF_ENERGY_MT_PRICE],
-                    description={"suffix": "€/kWh"},
-                ): vol.All(vol.Coerce(float), vol.Range(min=0, max=1)),
-                vol.Required(
-                    CONF_BLOCK_1_PRICE,
-                    default=DEFAULT_PRICES[CONF_BLOCK_1_PRICE],
-                    description={"suffix": "€/kWh"},
-                ): vol.All(vol.Coerce(float), vol.Range(min=0, max=1)),
-                vol.Required(
-                    CONF_BLOCK_2_PRICE,
-                    default=DEFAULT_PRICES[CONF_BLOCK_2_PRICE],
-                    description={"suffix": "€/kWh"},
-                ): vol.All(vol.Coerce(float), vol.Range(min=0, max=1)),
-                vol.Required(
-                    CONF_BLOCK_3_PRICE,
-                    default=DEFAULT_PRICES[CONF_BLOCK_3_PRICE],
-                    description={"suffix": "€/kWh"},
-                ): vol.All(vol.Coerce(float), vol.Range(min=0, max=1)),
-                vol.Required(
-                    CONF_BLOCK_4_PRICE,
-                    default=DEFAULT_PRICES[CONF_BLOCK_4_PRICE],
-                    description={"suffix": "€/kWh"},
-                ): vol.All(vol.Coerce(float), vol.Range(min=0, max=1)),
-                vol.Required(
-                    CONF_BLOCK_5_PRICE,
-                    default=DEFAULT_PRICES[CONF_BLOCK_5_PRICE],
-                    description={"suffix": "€/kWh"},
-                ): vol.All(vol.Coerce(float), vol.Range(min=0, max=1)),
-                vol.Required(
-                    CONF_CONTRIBUTIONS_PRICE,
-                    default=DEFAULT_PRICES[CONF_CONTRIBUTIONS_PRICE],
-                    description={"suffix": "€/kWh"},
-                ): vol.All(vol.Coerce(float), vol.Range(min=0, max=1)),
-                vol.Required(
-                    CONF_EXCISE_TAX,
-                    default=DEFAULT_PRICES[CONF_EXCISE_TAX],
-                    description={"suffix": "€/kWh"},
-                ): vol.All(vol.Coerce(float), vol.Range(min=0, max=1)),
-            }
-        )
-
         return self.async_show_form(
             step_id="prices",
-            data_schema=data_schema,
+            data_schema=_PRICES_SCHEMA,
             errors=errors,
             description_placeholders={
+                **_PRICES_PLACEHOLDERS_BASE,
                 "supplier": SUPPLIERS.get(self._supplier, "Unknown"),
-                "energy_vt_desc": ENERGY_DESCRIPTIONS["VT"],
-                "energy_mt_desc": ENERGY_DESCRIPTIONS["MT"],
-                "block_1_desc": BLOCK_DESCRIPTIONS[1],
-                "block_2_desc": BLOCK_DESCRIPTIONS[2],
-                "block_3_desc": BLOCK_DESCRIPTIONS[3],
-                "block_4_desc": BLOCK_DESCRIPTIONS[4],
-                "block_5_desc": BLOCK_DESCRIPTIONS[5],
-                "contributions_info": "Prispevki (RES, OVES, EKO sklad, itd.)",
-                "excise_info": "Trošarina na električno energijo",
             },
         )
 
@@ -225,41 +233,7 @@ class OptionsFlow(config_entries.OptionsFlow):
         if user_input is not None:
             return self.async_create_entry(title="", data=user_input)
 
-        data_schema = vol.Schema(
-            {
-                vol.Optional(
-                    CONF_AUTO_UPDATE,
-                    default=self.config_entry.data.get(CONF_AUTO_UPDATE, DEFAULT_AUTO_UPDATE),
-                ): bool,
-                vol.Optional(
-                    CONF_BLOCK_1_PRICE,
-                    default=self.config_entry.data.get(CONF_BLOCK_1_PRICE, DEFAULT_PRICES[CONF_BLOCK_1_PRICE]),
-                    description={"suffix": "€/kWh"},
-                ): vol.All(vol.Coerce(float), vol.Range(min=0, max=1)),
-                vol.Optional(
-                    CONF_BLOCK_2_PRICE,
-                    default=self.config_entry.data.get(CONF_BLOCK_2_PRICE, DEFAULT_PRICES[CONF_BLOCK_2_PRICE]),
-                    description={"suffix": "€/kWh"},
-                ): vol.All(vol.Coerce(float), vol.Range(min=0, max=1)),
-                vol.Optional(
-                    CONF_BLOCK_3_PRICE,
-                    default=self.config_entry.data.get(CONF_BLOCK_3_PRICE, DEFAULT_PRICES[CONF_BLOCK_3_PRICE]),
-                    description={"suffix": "€/kWh"},
-                ): vol.All(vol.Coerce(float), vol.Range(min=0, max=1)),
-                vol.Optional(
-                    CONF_BLOCK_4_PRICE,
-                    default=self.config_entry.data.get(CONF_BLOCK_4_PRICE, DEFAULT_PRICES[CONF_BLOCK_4_PRICE]),
-                    description={"suffix": "€/kWh"},
-                ): vol.All(vol.Coerce(float), vol.Range(min=0, max=1)),
-                vol.Optional(
-                    CONF_BLOCK_5_PRICE,
-                    default=self.config_entry.data.get(CONF_BLOCK_5_PRICE, DEFAULT_PRICES[CONF_BLOCK_5_PRICE]),
-                    description={"suffix": "€/kWh"},
-                ): vol.All(vol.Coerce(float), vol.Range(min=0, max=1)),
-            }
-        )
-
         return self.async_show_form(
             step_id="init",
-            data_schema=data_schema,
+            data_schema=_options_schema(self.config_entry.data),
         )
\ No newline at end of file
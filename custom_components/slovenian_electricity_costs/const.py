@@ -1,9 +1,15 @@
 """Constants for the Slovenian Electricity Costs integration."""
 from datetime import date, datetime, timedelta
-from typing import Dict, List
+from functools import lru_cache
+from types import MappingProxyType
+from typing import NamedTuple
 
 DOMAIN = "slovenian_electricity_costs"
 
+# Events fired by services
+EVENT_CURRENT_BLOCK = f"{DOMAIN}_current_block"
+EVENT_COST_CALCULATED = f"{DOMAIN}_cost_calculated"
+
 # Configuration keys
 CONF_SUPPLIER = "supplier"
 CONF_AUTO_UPDATE = "auto_update"
@@ -20,6 +26,15 @@ CONF_BLOCK_5_PRICE = "block_5_price"      # Omrežnina blok 5
 CONF_CONTRIBUTIONS_PRICE = "contributions_price"  # Prispevki (RES, OVES, itd.)
 CONF_EXCISE_TAX = "excise_tax"             # Trošarina
 
+# Network block price keys, in block order (omrežnina blok 1-5)
+BLOCK_PRICE_KEYS = (
+    CONF_BLOCK_1_PRICE,
+    CONF_BLOCK_2_PRICE,
+    CONF_BLOCK_3_PRICE,
+    CONF_BLOCK_4_PRICE,
+    CONF_BLOCK_5_PRICE,
+)
+
 # Default values
 DEFAULT_SCAN_INTERVAL = 60  # seconds
 DEFAULT_AUTO_UPDATE = False
@@ -38,22 +53,23 @@ SUPPLIERS = {
     "other": "Drug dobavitelj",
 }
 
-# Fixed Slovenian holidays (MM-DD format)
-FIXED_SLOVENIAN_HOLIDAYS = [
-    "01-01",  # New Year's Day
-    "01-02",  # New Year's Day (second day)
-    "02-08",  # Prešeren Day
-    "04-27",  # Day of Uprising Against Occupation
-    "05-01",  # Labour Day
-    "05-02",  # Labour Day (second day)
-    "06-25",  # Statehood Day
-    "08-15",  # Assumption Day
-    "10-31",  # Reformation Day
-    "11-01",  # Remembrance Day
-    "12-25",  # Christmas Day
-    "12-26",  # Independence and Unity Day
-]
+# Fixed Slovenian holidays as (month, day)
+FIXED_SLOVENIAN_HOLIDAYS = (
+    (1, 1),    # New Year's Day
+    (1, 2),    # New Year's Day (second day)
+    (2, 8),    # Prešeren Day
+    (4, 27),   # Day of Uprising Against Occupation
+    (5, 1),    # Labour Day
+    (5, 2),    # Labour Day (second day)
+    (6, 25),   # Statehood Day
+    (8, 15),   # Assumption Day
+    (10, 31),  # Reformation Day
+    (11, 1),   # Remembrance Day
+    (12, 25),  # Christmas Day
+    (12, 26),  # Independence and Unity Day
+)
 
+@lru_cache(maxsize=8)
 def calculate_easter_sunday(year: int) -> date:
     """Calculate Easter Sunday for a given year using the algorithm."""
     # Algorithm for calculating Easter (Gregorian calendar)
@@ -73,153 +89,197 @@ def calculate_easter_sunday(year: int) -> date:
     day = ((h + l - 7 * m + 114) % 31) + 1
     return date(year, month, day)
 
-def get_slovenian_holidays_for_year(year: int) -> List[str]:
-    """Get all Slovenian holidays for a given year in MM-DD format."""
-    holidays = FIXED_SLOVENIAN_HOLIDAYS.copy()
-    
-    # Calculate dynamic holidays based on Easter
+@lru_cache(maxsize=8)
+def get_slovenian_holidays_for_year(year: int) -> frozenset[tuple[int, int]]:
+    """Get all Slovenian holidays for a given year as (month, day) pairs."""
+    # Easter Monday (day after Easter Sunday) and Whit Sunday (49 days after Easter)
     easter = calculate_easter_sunday(year)
-    
-    # Easter Monday (day after Easter Sunday)
-    easter_monday = easter + timedelta(days=1)
-    holidays.append(easter_monday.strftime("%m-%d"))
-    
-    # Whit Sunday (49 days after Easter)
-    whit_sunday = easter + timedelta(days=49)
-    holidays.append(whit_sunday.strftime("%m-%d"))
-    
-    return holidays
+    return frozenset(FIXED_SLOVENIAN_HOLIDAYS).union(
+        (day.month, day.day)
+        for day in (easter + timedelta(days=1), easter + timedelta(days=49))
+    )
+
+def invalidate_holiday_cache() -> None:
+    """Clear the cached Easter and holiday calculations (for tests)."""
+    get_slovenian_holidays_for_year.cache_clear()
+    calculate_easter_sunday.cache_clear()
 
 def is_holiday(dt: datetime) -> bool:
     """Check if a given datetime is a Slovenian holiday."""
-    holidays = get_slovenian_holidays_for_year(dt.year)
-    date_str = dt.strftime("%m-%d")
-    return date_str in holidays
+    return (dt.month, dt.day) in get_slovenian_holidays_for_year(dt.year)
+
+# VT (Visoka tarifa): Monday-Friday 6:00-22:00
+# MT (Mala tarifa): Monday-Friday 22:00-6:00, all day Saturday, Sunday and holidays
+# Indexed by (is_holiday << 8) | (weekday << 5) | hour
+_ENERGY_TARIFF_TABLE = tuple(
+    "VT" if not holiday and weekday < 5 and 6 <= hour < 22 else "MT"
+    for holiday in (0, 1)
+    for weekday in range(8)
+    for hour in range(32)
+)
+
+def _energy_tariff_from(dt: datetime, is_holiday_today: bool, weekday: int) -> str:
+    """Determine VT/MT from precomputed holiday and weekday values."""
+    return _ENERGY_TARIFF_TABLE[(is_holiday_today << 8) | (weekday << 5) | dt.hour]
 
 def get_energy_tariff(dt: datetime) -> str:
     """Determine if time is VT (high) or MT (low) for electrical energy."""
-    # VT (Visoka tarifa): Monday-Friday 6:00-22:00
-    # MT (Mala tarifa): Monday-Friday 22:00-6:00, all day Saturday, Sunday and holidays
-    
-    if is_holiday(dt) or dt.weekday() >= 5:  # Weekend or holiday
-        return "MT"
-    
-    # Weekday
-    hour = dt.hour
-    if 6 <= hour < 22:
-        return "VT"
-    else:
-        return "MT"
+    return _energy_tariff_from(dt, is_holiday(dt), dt.weekday())
+
+class PriceResult(NamedTuple):
+    """Price breakdown for one moment; use _asdict() where a dict is needed."""
+
+    energy_tariff: str
+    energy_price: float
+    current_block: int
+    network_price: float
+    contributions: float
+    excise_tax: float
+    total_price: float
+    # Resolved along the way, so callers need not look them up again
+    season: str
+    is_holiday: bool
 
 def calculate_total_price_per_kwh(dt: datetime, energy_vt_price: float, energy_mt_price: float, 
-                                 network_prices: dict, contributions: float, excise: float) -> dict:
-    """Calculate total price per kWh including all components."""
+                                 network_prices: tuple[float, ...], contributions: float, excise: float) -> PriceResult:
+    """Calculate total price per kWh including all components.
+
+    network_prices is indexed by block number:
+    (0.0, block_1, block_2, block_3, block_4, block_5).
+    """
     # Get current tariff block for network charges
-    season = get_season(dt)
+    month = dt.month
+    higher_season = _IS_HIGHER_SEASON[month]
+    weekday = dt.weekday()
     is_holiday_today = is_holiday(dt)
     
-    # Determine network schedule
-    if is_holiday_today or dt.weekday() >= 5:  # Weekend (Saturday/Sunday) or holiday
-        if season == "higher":
-            schedule = WEEKEND_HOLIDAY_SCHEDULE_HIGHER
-        else:
-            schedule = WEEKEND_HOLIDAY_SCHEDULE_LOWER
-    else:  # Monday to Friday (weekdays)
-        if season == "higher":
-            schedule = WEEKDAY_SCHEDULE_HIGHER
-        else:
-            schedule = WEEKDAY_SCHEDULE_LOWER
-
-    # Find current tariff block
-    current_time = dt.strftime("%H:%M")
-    current_block = 3  # default
-    
-    for slot in schedule:
-        start_time = slot["start"]
-        end_time = slot["end"]
-        if end_time == "24:00":
-            end_time = "23:59"
-        if start_time <= current_time <= end_time:
-            current_block = slot["block"]
-            break
+    # Weekend (Saturday/Sunday) and holiday blocks follow the weekday ones
+    table = _BLOCK_TABLE_HIGHER if higher_season else _BLOCK_TABLE_LOWER
+    offset = 1440 if is_holiday_today or weekday >= 5 else 0
+    current_block = table[offset + dt.hour * 60 + dt.minute]
     
     # Get energy tariff (VT/MT)
-    energy_tariff = get_energy_tariff(dt)
+    energy_tariff = _energy_tariff_from(dt, is_holiday_today, weekday)
     
     # Calculate total price
     energy_price = energy_vt_price if energy_tariff == "VT" else energy_mt_price
-    network_price = network_prices.get(current_block, 0)
+    network_price = network_prices[current_block]
     
     total_price = energy_price + network_price + contributions + excise
     
-    return {
-        "energy_tariff": energy_tariff,
-        "energy_price": energy_price,
-        "current_block": current_block,
-        "network_price": network_price,
-        "contributions": contributions,
-        "excise_tax": excise,
-        "total_price": total_price,
-    }
+    return PriceResult(
+        energy_tariff=energy_tariff,
+        energy_price=energy_price,
+        current_block=current_block,
+        network_price=network_price,
+        contributions=contributions,
+        excise_tax=excise,
+        total_price=total_price,
+        season=_SEASON_BY_MONTH[month],
+        is_holiday=is_holiday_today,
+    )
+
+# Higher season (Winter): November to February (11,12,1,2) - po slovenskem sistemu
+# Lower season (Summer): March to October (3,4,5,6,7,8,9,10)
+# Indexed by month number (index 0 unused)
+_IS_HIGHER_SEASON = (False, True, True) + (False,) * 8 + (True, True)
+_SEASON_BY_MONTH = tuple(
+    "higher" if higher else "lower" for higher in _IS_HIGHER_SEASON
+)
 
 def get_season(dt: datetime) -> str:
     """Determine if date is in higher or lower season."""
-    month = dt.month
-    # Higher season (Winter): November to February (11,12,1,2) - po slovenskem sistemu
-    # Lower season (Summer): March to October (3,4,5,6,7,8,9,10)
-    if month in [11, 12, 1, 2]:
-        return "higher"
-    else:
-        return "lower"
+    return _SEASON_BY_MONTH[dt.month]
+
+def _to_min(hhmm: str) -> int:
+    """Convert "HH:MM" to minutes since midnight ("24:00" becomes 1440)."""
+    return int(hhmm[:2]) * 60 + int(hhmm[3:])
+
+def _parse_schedule(
+    slots: tuple[tuple[str, str, int], ...]
+) -> tuple[tuple[int, int, int], ...]:
+    """Convert ("HH:MM", "HH:MM", block) slots to (start_min, end_min, block)."""
+    return tuple((_to_min(start), _to_min(end), block) for start, end, block in slots)
 
 # Tariff block schedules - Higher season (October-March)
 # Schedule for workdays (Monday to Friday) - Higher season
-WEEKDAY_SCHEDULE_HIGHER = [
-    {"start": "00:00", "end": "06:00", "block": 3},  # Night
-    {"start": "06:00", "end": "07:00", "block": 2},  # Early morning
-    {"start": "07:00", "end": "14:00", "block": 1},  # Morning/day peak (most expensive)
-    {"start": "14:00", "end": "16:00", "block": 2},  # Afternoon
-    {"start": "16:00", "end": "20:00", "block": 1},  # Evening peak (most expensive)
-    {"start": "20:00", "end": "22:00", "block": 2},  # Evening
-    {"start": "22:00", "end": "24:00", "block": 3},  # Night
-]
+WEEKDAY_SCHEDULE_HIGHER = _parse_schedule((
+    ("00:00", "06:00", 3),  # Night
+    ("06:00", "07:00", 2),  # Early morning
+    ("07:00", "14:00", 1),  # Morning/day peak (most expensive)
+    ("14:00", "16:00", 2),  # Afternoon
+    ("16:00", "20:00", 1),  # Evening peak (most expensive)
+    ("20:00", "22:00", 2),  # Evening
+    ("22:00", "24:00", 3),  # Night
+))
 
 # Schedule for workdays (Monday to Friday) - Lower season
-WEEKDAY_SCHEDULE_LOWER = [
-    {"start": "00:00", "end": "06:00", "block": 4},  # Night
-    {"start": "06:00", "end": "07:00", "block": 3},  # Early morning
-    {"start": "07:00", "end": "14:00", "block": 2},  # Morning/day peak (most expensive)
-    {"start": "14:00", "end": "16:00", "block": 3},  # Afternoon
-    {"start": "16:00", "end": "20:00", "block": 2},  # Evening peak (most expensive)
-    {"start": "20:00", "end": "22:00", "block": 3},  # Evening
-    {"start": "22:00", "end": "24:00", "block": 4},  # Night
-]
+_WEEKDAY_SLOTS_LOWER = (
+    ("00:00", "06:00", 4),  # Night
+    ("06:00", "07:00", 3),  # Early morning
+    ("07:00", "14:00", 2),  # Morning/day peak (most expensive)
+    ("14:00", "16:00", 3),  # Afternoon
+    ("16:00", "20:00", 2),  # Evening peak (most expensive)
+    ("20:00", "22:00", 3),  # Evening
+    ("22:00", "24:00", 4),  # Night
+)
+WEEKDAY_SCHEDULE_LOWER = _parse_schedule(_WEEKDAY_SLOTS_LOWER)
 
 # Schedule for weekends and holidays - Higher season (Saturday, Sunday, holidays)
-WEEKEND_HOLIDAY_SCHEDULE_HIGHER = [
-    {"start": "00:00", "end": "06:00", "block": 4},  # Night
-    {"start": "06:00", "end": "07:00", "block": 3},  # Early morning
-    {"start": "07:00", "end": "14:00", "block": 2},  # Day peak (most expensive)
-    {"start": "14:00", "end": "16:00", "block": 3},  # Afternoon
-    {"start": "16:00", "end": "20:00", "block": 2},  # Evening peak (most expensive)
-    {"start": "20:00", "end": "22:00", "block": 3},  # Evening
-    {"start": "22:00", "end": "24:00", "block": 4},  # Night
-]
+WEEKEND_HOLIDAY_SCHEDULE_HIGHER = _parse_schedule((
+    ("00:00", "06:00", 4),  # Night
+    ("06:00", "07:00", 3),  # Early morning
+    ("07:00", "14:00", 2),  # Day peak (most expensive)
+    ("14:00", "16:00", 3),  # Afternoon
+    ("16:00", "20:00", 2),  # Evening peak (most expensive)
+    ("20:00", "22:00", 3),  # Evening
+    ("22:00", "24:00", 4),  # Night
+))
 
 # Schedule for weekends and holidays - Lower season (Saturday, Sunday, holidays)
-WEEKEND_HOLIDAY_SCHEDULE_LOWER = [
-    {"start": "00:00", "end": "06:00", "block": 5},  # Night (cheapest)
-    {"start": "06:00", "end": "07:00", "block": 4},  # Early morning
-    {"start": "07:00", "end": "14:00", "block": 3},  # Day peak (most expensive)
-    {"start": "14:00", "end": "16:00", "block": 4},  # Afternoon
-    {"start": "16:00", "end": "20:00", "block": 3},  # Evening peak (most expensive)
-    {"start": "20:00", "end": "22:00", "block": 4},  # Evening
-    {"start": "22:00", "end": "24:00", "block": 5},  # Night (cheapest)
-]
-
-# Legacy schedules for backward compatibility
-WEEKDAY_SCHEDULE = WEEKDAY_SCHEDULE_LOWER
-WEEKEND_HOLIDAY_SCHEDULE = WEEKEND_HOLIDAY_SCHEDULE_LOWER
+_WEEKEND_HOLIDAY_SLOTS_LOWER = (
+    ("00:00", "06:00", 5),  # Night (cheapest)
+    ("06:00", "07:00", 4),  # Early morning
+    ("07:00", "14:00", 3),  # Day peak (most expensive)
+    ("14:00", "16:00", 4),  # Afternoon
+    ("16:00", "20:00", 3),  # Evening peak (most expensive)
+    ("20:00", "22:00", 4),  # Evening
+    ("22:00", "24:00", 5),  # Night (cheapest)
+)
+WEEKEND_HOLIDAY_SCHEDULE_LOWER = _parse_schedule(_WEEKEND_HOLIDAY_SLOTS_LOWER)
+
+def _compile_schedule(slots: tuple[tuple[int, int, int], ...]) -> bytes:
+    """Expand a tariff schedule into a block number for every minute of the day."""
+    table = bytearray(1440)
+    for start, end, block in slots:
+        table[start:end] = bytes((block,)) * (end - start)
+    return bytes(table)
+
+# Tariff block per minute of day (index = hour * 60 + minute)
+BLOCK_TABLE_WEEKDAY_HIGHER = _compile_schedule(WEEKDAY_SCHEDULE_HIGHER)
+BLOCK_TABLE_WEEKDAY_LOWER = _compile_schedule(WEEKDAY_SCHEDULE_LOWER)
+BLOCK_TABLE_WEEKEND_HOLIDAY_HIGHER = _compile_schedule(WEEKEND_HOLIDAY_SCHEDULE_HIGHER)
+BLOCK_TABLE_WEEKEND_HOLIDAY_LOWER = _compile_schedule(WEEKEND_HOLIDAY_SCHEDULE_LOWER)
+
+# Weekday table followed by the weekend/holiday table, one per season
+# (index = 1440 for weekends and holidays + hour * 60 + minute)
+_BLOCK_TABLE_HIGHER = BLOCK_TABLE_WEEKDAY_HIGHER + BLOCK_TABLE_WEEKEND_HOLIDAY_HIGHER
+_BLOCK_TABLE_LOWER = BLOCK_TABLE_WEEKDAY_LOWER + BLOCK_TABLE_WEEKEND_HOLIDAY_LOWER
+
+def _legacy_schedule(
+    slots: tuple[tuple[str, str, int], ...]
+) -> tuple[MappingProxyType, ...]:
+    """Convert ("HH:MM", "HH:MM", block) slots to the old {"start", "end", "block"} form."""
+    return tuple(
+        MappingProxyType({"start": start, "end": end, "block": block})
+        for start, end, block in slots
+    )
+
+# Legacy lower season schedules for backward compatibility, in their original
+# {"start": "HH:MM", "end": "HH:MM", "block": n} shape; built from the same
+# source slots as the block tables and read-only, so they cannot drift from them
+WEEKDAY_SCHEDULE = _legacy_schedule(_WEEKDAY_SLOTS_LOWER)
+WEEKEND_HOLIDAY_SCHEDULE = _legacy_schedule(_WEEKEND_HOLIDAY_SLOTS_LOWER)
 
 # Block descriptions (for network charges - omrežnina)
 # Note: Block 1 is most expensive, Block 5 is cheapest
@@ -275,3 +335,31 @@ SEASON_INFO = {
         "description": "Poletna tarifa z nižjimi tarifami"
     }
 }
+
+# Read-only views so lookups hand out shared references that cannot be mutated
+SUPPLIERS = MappingProxyType(SUPPLIERS)
+DEFAULT_PRICES = MappingProxyType(DEFAULT_PRICES)
+BLOCK_DESCRIPTIONS = MappingProxyType(BLOCK_DESCRIPTIONS)
+# Block descriptions indexed by block number; index 0 is never a valid block
+BLOCK_DESCRIPTIONS_BY_BLOCK = (
+    "Unknown",
+    *(BLOCK_DESCRIPTIONS[block] for block in range(1, 6)),
+)
+ENERGY_DESCRIPTIONS = MappingProxyType(ENERGY_DESCRIPTIONS)
+SEASON_INFO = MappingProxyType(
+    {season: MappingProxyType(info) for season, info in SEASON_INFO.items()}
+)
+
+# Flat per-field season lookups, one hash per attribute
+SEASON_NAME = MappingProxyType(
+    {season: info.get("name", "Unknown") for season, info in SEASON_INFO.items()}
+)
+SEASON_MONTHS = MappingProxyType(
+    {season: info.get("months", "Unknown") for season, info in SEASON_INFO.items()}
+)
+SEASON_DESCRIPTION = MappingProxyType(
+    {season: info.get("description", "Unknown") for season, info in SEASON_INFO.items()}
+)
+
+# Shared default for .get() lookups so a miss does not allocate a new dict
+EMPTY_MAPPING = MappingProxyType({})
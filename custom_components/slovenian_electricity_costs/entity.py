@@ -0,0 +1,99 @@
+"""Base entity for Slovenian Electricity Costs integration."""
+from __future__ import annotations
+
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any
+
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import EMPTY_MAPPING
+
+
+class SlovenianElectricityCostsEntity(CoordinatorEntity):
+    """Coordinator entity that memoizes its attributes and skips no-op writes."""
+
+    __slots__ = (
+        "_attrs_data",
+        "_attrs_cached",
+        "_pushed_data",
+        "_pushed_success",
+        "_last_pushed",
+    )
+
+    _attr_has_entity_name = True
+    # State is pushed by the coordinator, never polled
+    _attr_should_poll = False
+
+    def __init__(self, coordinator, device_info: Mapping[str, Any]) -> None:
+        """Initialize the entity."""
+        super().__init__(coordinator)
+        # Shared read-only device info for every entity of this entry
+        self._attr_device_info = device_info
+        # Coordinator result the memoized attributes were built from
+        self._attrs_data: dict[str, Any] | None = None
+        self._attrs_cached: Mapping[str, Any] = EMPTY_MAPPING
+        # Coordinator result and status of the last state write
+        self._pushed_data: dict[str, Any] | None = None
+        self._pushed_success: bool | None = None
+        # State and attributes of the last coordinator-driven state write
+        self._last_pushed: tuple[Any, ...] | None = None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when something this entity shows has changed."""
+        data = self.coordinator.data
+        success = self.coordinator.last_update_success
+        # The coordinator hands back the same dict while its result is unchanged
+        if data is self._pushed_data and success == self._pushed_success:
+            return
+
+        self._pushed_data = data
+        self._pushed_success = success
+        # A new result often leaves this entity's state and attributes as they
+        # were; values are pre-rounded, so plain equality matches the display
+        pushed = (success, self._shown_state(data))
+        if pushed == self._last_pushed:
+            return
+
+        self._last_pushed = pushed
+        self.async_write_ha_state()
+
+    def _shown_value(self) -> Any:
+        """Return the state value a write would report."""
+        raise NotImplementedError
+
+    def _shown_state(self, data: dict[str, Any] | None) -> tuple[Any, ...] | None:
+        """Return the state and attributes a state write would report."""
+        if data is None:
+            return None
+
+        attrs = self.extra_state_attributes
+        # The timestamp alone does not warrant a new state
+        return (
+            self._shown_value(),
+            {key: value for key, value in attrs.items() if key != "last_updated"},
+        )
+
+    def _invalidate_attrs(self) -> None:
+        """Rebuild the attributes on next read, for inputs outside coordinator data."""
+        self._attrs_data = None
+        # The written state no longer matches the last coordinator push
+        self._last_pushed = None
+
+    def _build_attrs(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Return the extra state attributes for a coordinator result."""
+        return {}
+
+    @property
+    def extra_state_attributes(self) -> Mapping[str, Any]:
+        """Return extra state attributes, rebuilt once per coordinator result."""
+        data = self.coordinator.data
+        if data is None:
+            return {}
+
+        if data is not self._attrs_data:
+            self._attrs_cached = MappingProxyType(self._build_attrs(data))
+            self._attrs_data = data
+        return self._attrs_cached
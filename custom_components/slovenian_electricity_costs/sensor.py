@@ -2,514 +2,507 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
 from homeassistant.components.sensor import (
+    RestoreSensor,
     SensorDeviceClass,
     SensorEntity,
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CURRENCY_EURO
-from homeassistant.core import HomeAssistant
+from homeassistant.const import CURRENCY_EURO, STATE_UNAVAILABLE, STATE_UNKNOWN
+from homeassistant.core import Event, HomeAssistant, State, callback
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.helpers.event import async_track_state_change_event
 
 from .const import (
     DOMAIN,
     CONF_CONSUMPTION_SENSOR,
-    BLOCK_DESCRIPTIONS,
-    ENERGY_DESCRIPTIONS,
-    SEASON_INFO,
+    BLOCK_DESCRIPTIONS_BY_BLOCK,
+    EMPTY_MAPPING,
+    SEASON_MONTHS,
+    SEASON_DESCRIPTION,
 )
+from .entity import SlovenianElectricityCostsEntity
 
 _LOGGER = logging.getLogger(__name__)
 
+_UNIT_EUR_PER_KWH = f"{CURRENCY_EURO}/kWh"
 
-async def async_setup_entry(
-    hass: HomeAssistant,
-    config_entry: ConfigEntry,
-    async_add_entities: AddEntitiesCallback,
-) -> None:
-    """Set up the sensor platform."""
-    coordinator = hass.data[DOMAIN][config_entry.entry_id]
 
-    # Create all sensors
-    entities = []
+# Consumption sensor states that can never parse as a number
+_INVALID_CONSUMPTION_STATES = frozenset({STATE_UNAVAILABLE, STATE_UNKNOWN, "None", "none", ""})
+
+
+def _parse_consumption(state: State | None) -> float | None:
+    """Return a consumption reading in kWh, or None if it is not a number."""
+    if state is None or state.state in _INVALID_CONSUMPTION_STATES:
+        return None
+
+    try:
+        return float(state.state)
+    except (ValueError, TypeError):
+        return None
 
-    # Current tariff block sensor
-    entities.append(CurrentTariffBlockSensor(coordinator, config_entry))
 
-    # Current electricity price sensor (total)
-    entities.append(CurrentElectricityPriceSensor(coordinator, config_entry))
+def _block_base_attrs(block: int) -> Mapping[str, Any]:
+    """Return the attributes of a block price sensor that never change."""
+    attrs = {
+        "block": block,
+        "description": BLOCK_DESCRIPTIONS_BY_BLOCK[block],
+    }
 
-    # Energy tariff sensor (VT/MT)
-    entities.append(EnergyTariffSensor(coordinator, config_entry))
+    # Add special note for block 5
+    if block == 5:
+        attrs["season_note"] = "Block 5 is only used in higher season (Oct-Mar)"
 
-    # Individual component sensors
-    entities.append(EnergyPriceSensor(coordinator, config_entry))
-    entities.append(NetworkPriceSensor(coordinator, config_entry))
-    entities.append(ContributionsPriceSensor(coordinator, config_entry))
-    entities.append(ExciseTaxSensor(coordinator, config_entry))
+    return MappingProxyType(attrs)
 
-    # Current season sensor
-    entities.append(CurrentSeasonSensor(coordinator, config_entry))
 
-    # Holiday status sensor
-    entities.append(HolidayStatusSensor(coordinator, config_entry))
+# Fixed block price sensor attributes, indexed by block number
+_BLOCK_BASE_ATTRS = (EMPTY_MAPPING, *(_block_base_attrs(block) for block in range(1, 6)))
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the sensor platform."""
+    entry_data = hass.data[DOMAIN][config_entry.entry_id]
+    coordinator = entry_data["coordinator"]
+    device_info = entry_data["device_info"]
+
+    base = (
+        # Current tariff block and total price
+        CurrentTariffBlockSensor(coordinator, config_entry, device_info),
+        CurrentElectricityPriceSensor(coordinator, config_entry, device_info),
+        # Energy tariff sensor (VT/MT)
+        EnergyTariffSensor(coordinator, config_entry, device_info),
+        # Individual component sensors
+        EnergyPriceSensor(coordinator, config_entry, device_info),
+        NetworkPriceSensor(coordinator, config_entry, device_info),
+        ContributionsPriceSensor(coordinator, config_entry, device_info),
+        ExciseTaxSensor(coordinator, config_entry, device_info),
+        # Season and holiday status sensors
+        CurrentSeasonSensor(coordinator, config_entry, device_info),
+        HolidayStatusSensor(coordinator, config_entry, device_info),
+    )
 
     # Electricity cost sensor (if consumption sensor is configured)
     consumption_sensor = config_entry.data.get(CONF_CONSUMPTION_SENSOR)
-    if consumption_sensor:
-        entities.append(ElectricityCostSensor(coordinator, config_entry, consumption_sensor))
+    extra = (
+        (ElectricityCostSensor(coordinator, config_entry, device_info, consumption_sensor),)
+        if consumption_sensor
+        else ()
+    )
 
     # Individual price sensors for each network block
-    for block in range(1, 6):
-        entities.append(NetworkBlockPriceSensor(coordinator, config_entry, block))
+    blocks = (
+        TariffBlockPriceSensor(coordinator, config_entry, device_info, block)
+        for block in range(1, 6)
+    )
 
-    async_add_entities(entities)
+    async_add_entities((*base, *extra, *blocks))
 
 
-class SlovenianElectricityCostsSensorBase(CoordinatorEntity, SensorEntity):
+class SlovenianElectricityCostsSensorBase(SlovenianElectricityCostsEntity, SensorEntity):
     """Base class for Slovenian Electricity Costs sensors."""
 
-    def __init__(self, coordinator, config_entry: ConfigEntry) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._config_entry = config_entry
-        self._attr_has_entity_name = True
+    # Appended to the config entry ID to form the unique ID; every sensor
+    # must set its own, so there is deliberately no default
+    _UID_SUFFIX: str
 
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device information."""
+    def __init__(
+        self, coordinator, config_entry: ConfigEntry, device_info: Mapping[str, Any]
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, device_info)
+        suffix = self._unique_id_suffix()
+        assert suffix, f"{type(self).__name__} has no unique ID suffix"
+        self._attr_unique_id = config_entry.entry_id + suffix
+
+    def _unique_id_suffix(self) -> str:
+        """Return the suffix that distinguishes this sensor's unique ID."""
+        return self._UID_SUFFIX
+
+    def _shown_value(self) -> Any:
+        """Return the sensor value a write would report."""
+        return self.native_value
+
+    @staticmethod
+    def _common(data: dict[str, Any]) -> dict[str, Any]:
+        """Return the attributes shared by every sensor."""
+        return {"last_updated": data.get("last_updated")}
+
+    @staticmethod
+    def _common_with_season(data: dict[str, Any]) -> dict[str, Any]:
+        """Return the shared attributes plus the season and holiday status."""
         return {
-            "identifiers": {(DOMAIN, self._config_entry.entry_id)},
-            "name": "Slovenian Electricity Costs",
-            "manufacturer": "49jan",
-            "model": "Tariff Calculator",
-            "sw_version": "1.1-b",
+            "season": data.get("season", "lower"),
+            "season_name": data["season_name"],
+            "is_holiday": data.get("is_holiday", False),
+            "last_updated": data.get("last_updated"),
         }
 
+    @property
+    def available(self) -> bool:
+        """Return True once the coordinator has produced data."""
+        return super().available and self.coordinator.data is not None
+
 
 class CurrentTariffBlockSensor(SlovenianElectricityCostsSensorBase):
     """Sensor for current tariff block."""
 
-    def __init__(self, coordinator, config_entry: ConfigEntry) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator, config_entry)
-        self._attr_unique_id = f"{config_entry.entry_id}_electricity_current_tariff_block"
-        self._attr_name = "Electricity Current Tariff Block"
-        self._attr_icon = "mdi:clock-time-four"
+    _attr_name = "Electricity Current Tariff Block"
+    _attr_icon = "mdi:clock-time-four"
+    _UID_SUFFIX = "_electricity_current_tariff_block"
 
     @property
     def native_value(self) -> int | None:
         """Return the current tariff block."""
-        if self.coordinator.data is None:
-            return None
         return self.coordinator.data.get("current_block")
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def _build_attrs(self, data: dict[str, Any]) -> dict[str, Any]:
         """Return extra state attributes."""
-        if self.coordinator.data is None:
-            return {}
-        
-        current_block = self.coordinator.data.get("current_block")
-        season = self.coordinator.data.get("season", "lower")
-        
         return {
-            "block_description": BLOCK_DESCRIPTIONS.get(current_block, "Unknown"),
-            "season": season,
-            "season_name": SEASON_INFO.get(season, {}).get("name", "Unknown"),
-            "is_holiday": self.coordinator.data.get("is_holiday", False),
-            "last_updated": self.coordinator.data.get("last_updated"),
+            "block_description": data["block_description"],
+            **self._common_with_season(data),
         }
 
 
 class CurrentElectricityPriceSensor(SlovenianElectricityCostsSensorBase):
     """Sensor for current total electricity price (all components)."""
 
-    def __init__(self, coordinator, config_entry: ConfigEntry) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator, config_entry)
-        self._attr_unique_id = f"{config_entry.entry_id}_electricity_current_total_price"
-        self._attr_name = "Electricity Current Total Price"
-        self._attr_icon = "mdi:currency-eur"
-        self._attr_native_unit_of_measurement = f"{CURRENCY_EURO}/kWh"
-        self._attr_device_class = SensorDeviceClass.MONETARY
-        self._attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_name = "Electricity Current Total Price"
+    _attr_icon = "mdi:currency-eur"
+    _attr_native_unit_of_measurement = _UNIT_EUR_PER_KWH
+    _attr_device_class = SensorDeviceClass.MONETARY
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _UID_SUFFIX = "_electricity_current_total_price"
 
     @property
     def native_value(self) -> float | None:
         """Return the current total electricity price."""
-        if self.coordinator.data is None:
-            return None
-        return round(self.coordinator.data.get("total_price", 0), 6)
+        return self.coordinator.data["total_price_rounded"]
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def _build_attrs(self, data: dict[str, Any]) -> dict[str, Any]:
         """Return extra state attributes."""
-        if self.coordinator.data is None:
-            return {}
-        
-        current_block = self.coordinator.data.get("current_block")
-        season = self.coordinator.data.get("season", "lower")
-        energy_tariff = self.coordinator.data.get("energy_tariff", "MT")
+        current_block = data.get("current_block")
+        energy_tariff = data.get("energy_tariff", "MT")
         
         return {
             "energy_tariff": energy_tariff,
-            "energy_price": self.coordinator.data.get("energy_price", 0),
+            "energy_price": data.get("energy_price", 0),
             "current_block": current_block,
-            "network_price": self.coordinator.data.get("network_price", 0),
-            "contributions": self.coordinator.data.get("contributions", 0),
-            "excise_tax": self.coordinator.data.get("excise_tax", 0),
-            "season": season,
-            "season_name": SEASON_INFO.get(season, {}).get("name", "Unknown"),
-            "is_holiday": self.coordinator.data.get("is_holiday", False),
-            "last_updated": self.coordinator.data.get("last_updated"),
+            "network_price": data.get("network_price", 0),
+            "contributions": data.get("contributions", 0),
+            "excise_tax": data.get("excise_tax", 0),
+            **self._common_with_season(data),
         }
 
 
 class CurrentSeasonSensor(SlovenianElectricityCostsSensorBase):
     """Sensor for current electricity season."""
 
-    def __init__(self, coordinator, config_entry: ConfigEntry) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator, config_entry)
-        self._attr_unique_id = f"{config_entry.entry_id}_electricity_current_season"
-        self._attr_name = "Electricity Current Season"
-        self._attr_icon = "mdi:calendar-range"
-        self._attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_name = "Electricity Current Season"
+    _attr_icon = "mdi:calendar-range"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _UID_SUFFIX = "_electricity_current_season"
 
     @property
     def native_value(self) -> str | None:
         """Return the current season."""
-        if self.coordinator.data is None:
-            return None
-        
-        season = self.coordinator.data.get("season", "lower")
-        return SEASON_INFO.get(season, {}).get("name", "Unknown")
+        return self.coordinator.data["season_name"]
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def _build_attrs(self, data: dict[str, Any]) -> dict[str, Any]:
         """Return extra state attributes."""
-        if self.coordinator.data is None:
-            return {}
-        
-        season = self.coordinator.data.get("season", "lower")
-        season_info = SEASON_INFO.get(season, {})
+        season = data.get("season", "lower")
         
         return {
             "season_code": season,
-            "months": season_info.get("months", "Unknown"),
-            "description": season_info.get("description", "Unknown"),
-            "last_updated": self.coordinator.data.get("last_updated"),
+            "months": SEASON_MONTHS.get(season, "Unknown"),
+            "description": SEASON_DESCRIPTION.get(season, "Unknown"),
+            **self._common(data),
         }
 
 
 class HolidayStatusSensor(SlovenianElectricityCostsSensorBase):
     """Sensor for holiday status."""
 
-    def __init__(self, coordinator, config_entry: ConfigEntry) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator, config_entry)
-        self._attr_unique_id = f"{config_entry.entry_id}_electricity_current_holiday_status"
-        self._attr_name = "Electricity Current Holiday Status"
-        self._attr_icon = "mdi:calendar-star"
-        self._attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_name = "Electricity Current Holiday Status"
+    _attr_icon = "mdi:calendar-star"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _UID_SUFFIX = "_electricity_current_holiday_status"
 
     @property
     def native_value(self) -> str | None:
         """Return the holiday status."""
-        if self.coordinator.data is None:
-            return None
-        
         is_holiday = self.coordinator.data.get("is_holiday", False)
         return "Holiday" if is_holiday else "Working Day"
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def _build_attrs(self, data: dict[str, Any]) -> dict[str, Any]:
         """Return extra state attributes."""
-        if self.coordinator.data is None:
-            return {}
-        
         return {
-            "is_holiday": self.coordinator.data.get("is_holiday", False),
-            "holidays_this_year": self.coordinator.data.get("holidays_this_year", []),
-            "last_updated": self.coordinator.data.get("last_updated"),
+            "is_holiday": data.get("is_holiday", False),
+            "holidays_this_year": self.coordinator.get_holidays_this_year(),
+            **self._common(data),
         }
 
 
-class ElectricityCostSensor(SlovenianElectricityCostsSensorBase):
-    """Sensor for electricity cost calculation."""
+class ElectricityCostSensor(SlovenianElectricityCostsSensorBase, RestoreSensor):
+    """Sensor for electricity cost calculation.
 
-    def __init__(self, coordinator, config_entry: ConfigEntry, consumption_sensor: str) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator, config_entry)
-        self._consumption_sensor = consumption_sensor
-        self._attr_unique_id = f"{config_entry.entry_id}_electricity_total_cost"
-        self._attr_name = "Electricity Total Cost"
-        self._attr_icon = "mdi:cash"
-        self._attr_native_unit_of_measurement = CURRENCY_EURO
-        self._attr_device_class = SensorDeviceClass.MONETARY
-        self._attr_state_class = SensorStateClass.TOTAL_INCREASING
+    The cost only grows: each consumption increase is priced at the total
+    price in effect when it is reported, and the sum survives restarts.
+    """
 
-    @property
-    def native_value(self) -> float | None:
-        """Return the calculated electricity cost."""
-        if self.coordinator.data is None:
-            return None
-
-        # Get consumption from the configured sensor
-        consumption_state = self.hass.states.get(self._consumption_sensor)
-        if consumption_state is None or consumption_state.state == "unavailable":
-            return None
-
-        try:
-            consumption = float(consumption_state.state)
-            current_price = self.coordinator.data.get("current_price", 0)
-            return round(consumption * current_price, 2)
-        except (ValueError, TypeError):
-            return None
+    __slots__ = ("_consumption_sensor", "_consumption", "_cost")
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return extra state attributes."""
-        if self.coordinator.data is None:
-            return {}
+    _attr_name = "Electricity Total Cost"
+    _attr_icon = "mdi:cash"
+    _attr_native_unit_of_measurement = CURRENCY_EURO
+    _attr_device_class = SensorDeviceClass.MONETARY
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _UID_SUFFIX = "_electricity_total_cost"
 
-        consumption_state = self.hass.states.get(self._consumption_sensor)
-        consumption = 0
-        if consumption_state and consumption_state.state != "unavailable":
+    def __init__(
+        self,
+        coordinator,
+        config_entry: ConfigEntry,
+        device_info: Mapping[str, Any],
+        consumption_sensor: str,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, config_entry, device_info)
+        self._consumption_sensor = consumption_sensor
+        self._consumption: float | None = None
+        self._cost = 0.0
+
+    async def async_added_to_hass(self) -> None:
+        """Restore the accumulated cost and start tracking the consumption sensor."""
+        await super().async_added_to_hass()
+        last_data = await self.async_get_last_sensor_data()
+        if last_data is not None and last_data.native_value is not None:
             try:
-                consumption = float(consumption_state.state)
+                self._cost = float(last_data.native_value)
             except (ValueError, TypeError):
-                consumption = 0
+                self._cost = 0.0
+
+        # The current reading is the baseline; only later increases are charged
+        self._consumption = _parse_consumption(
+            self.hass.states.get(self._consumption_sensor)
+        )
+        self.async_on_remove(
+            async_track_state_change_event(
+                self.hass, [self._consumption_sensor], self._handle_consumption_change
+            )
+        )
+
+    @callback
+    def _handle_consumption_change(self, event: Event) -> None:
+        """Store the new consumption reading and update the cost."""
+        old_state = event.data["old_state"]
+        new_state = event.data["new_state"]
+        # Attribute-only changes keep the same reading, so skip re-parsing it
+        if (
+            old_state is not None
+            and new_state is not None
+            and old_state.state == new_state.state
+        ):
+            return
+
+        consumption = _parse_consumption(new_state)
+        if consumption is None:
+            # Keep the last reading so the gap is charged once the meter is back
+            return
+
+        previous = self._consumption
+        self._consumption = consumption
+        data = self.coordinator.data
+        if previous is not None and data is not None:
+            delta = consumption - previous
+            if delta < 0:
+                # The meter was reset; everything since the reset is new usage
+                delta = consumption
+            self._cost += delta * data["total_price"]
+
+        # Attributes include the consumption, so drop the memoized ones
+        self._invalidate_attrs()
+        self.async_write_ha_state()
 
-        current_block = self.coordinator.data.get("current_block")
-        current_price = self.coordinator.data.get("current_price", 0)
-        season = self.coordinator.data.get("season", "lower")
+    @property
+    def native_value(self) -> float:
+        """Return the electricity cost accumulated so far."""
+        return round(self._cost, 2)
 
+    def _build_attrs(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Return extra state attributes."""
         return {
-            "consumption_kwh": consumption,
-            "current_price": current_price,
-            "current_block": current_block,
-            "block_description": BLOCK_DESCRIPTIONS.get(current_block, "Unknown"),
-            "season": season,
-            "season_name": SEASON_INFO.get(season, {}).get("name", "Unknown"),
-            "is_holiday": self.coordinator.data.get("is_holiday", False),
+            "consumption_kwh": self._consumption if self._consumption is not None else 0,
+            "current_price": data["total_price"],
+            "current_block": data.get("current_block"),
+            "block_description": data["block_description"],
             "consumption_sensor": self._consumption_sensor,
-            "last_updated": self.coordinator.data.get("last_updated"),
+            **self._common_with_season(data),
         }
 
 
 class TariffBlockPriceSensor(SlovenianElectricityCostsSensorBase):
     """Sensor for individual tariff block prices."""
 
-    def __init__(self, coordinator, config_entry: ConfigEntry, block: int) -> None:
+    __slots__ = ("_block",)
+
+    _attr_icon = "mdi:currency-eur"
+    _attr_native_unit_of_measurement = _UNIT_EUR_PER_KWH
+    _attr_device_class = SensorDeviceClass.MONETARY
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    # Per-block unique ID suffixes and names, indexed by block number
+    _UID_SUFFIXES = (None, *(f"_electricity_block_{block}_price" for block in range(1, 6)))
+    _NAMES = (None, *(f"Electricity Block {block} Price" for block in range(1, 6)))
+
+    def __init__(
+        self,
+        coordinator,
+        config_entry: ConfigEntry,
+        device_info: Mapping[str, Any],
+        block: int,
+    ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator, config_entry)
+        # Set first, the base class reads it for the unique ID suffix
         self._block = block
-        self._attr_unique_id = f"{config_entry.entry_id}_electricity_block_{block}_price"
-        self._attr_name = f"Electricity Block {block} Price"
-        self._attr_icon = "mdi:currency-eur"
-        self._attr_native_unit_of_measurement = f"{CURRENCY_EURO}/kWh"
-        self._attr_device_class = SensorDeviceClass.MONETARY
-        self._attr_entity_category = EntityCategory.DIAGNOSTIC
+        super().__init__(coordinator, config_entry, device_info)
+        self._attr_name = self._NAMES[block]
+
+    def _unique_id_suffix(self) -> str:
+        """Return the suffix of this block's unique ID."""
+        return self._UID_SUFFIXES[self._block]
 
     @property
     def native_value(self) -> float | None:
         """Return the price for this tariff block."""
-        if self.coordinator.data is None:
-            return None
-        
-        prices = self.coordinator.data.get("prices", {})
-        return round(prices.get(self._block, 0), 6)
+        return self.coordinator.data["network_prices_rounded"][self._block]
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def _build_attrs(self, data: dict[str, Any]) -> dict[str, Any]:
         """Return extra state attributes."""
-        season = "lower"
-        if self.coordinator.data:
-            season = self.coordinator.data.get("season", "lower")
-            
-        attrs = {
-            "block": self._block,
-            "description": BLOCK_DESCRIPTIONS.get(self._block, "Unknown"),
-            "season": season,
-        }
-        
-        # Add special note for block 5
-        if self._block == 5:
-            attrs["season_note"] = "Block 5 is only used in higher season (Oct-Mar)"
-            
-        return attrs
+        return {**_BLOCK_BASE_ATTRS[self._block], "season": data.get("season", "lower")}
 
 
 class EnergyTariffSensor(SlovenianElectricityCostsSensorBase):
     """Sensor for current energy tariff (VT/MT)."""
 
-    def __init__(self, coordinator, config_entry: ConfigEntry) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator, config_entry)
-        self._attr_unique_id = f"{config_entry.entry_id}_electricity_current_energy_tariff"
-        self._attr_name = "Electricity Current Energy Tariff"
-        self._attr_icon = "mdi:lightning-bolt"
-        self._attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_name = "Electricity Current Energy Tariff"
+    _attr_icon = "mdi:lightning-bolt"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _UID_SUFFIX = "_electricity_current_energy_tariff"
 
     @property
     def native_value(self) -> str | None:
         """Return the current energy tariff."""
-        if self.coordinator.data is None:
-            return None
         return self.coordinator.data.get("energy_tariff", "MT")
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def _build_attrs(self, data: dict[str, Any]) -> dict[str, Any]:
         """Return extra state attributes."""
-        if self.coordinator.data is None:
-            return {}
-        
-        energy_tariff = self.coordinator.data.get("energy_tariff", "MT")
         return {
-            "tariff_code": energy_tariff,
-            "description": ENERGY_DESCRIPTIONS.get(energy_tariff, "Unknown"),
-            "last_updated": self.coordinator.data.get("last_updated"),
+            "tariff_code": data.get("energy_tariff", "MT"),
+            "description": data["energy_tariff_description"],
+            **self._common(data),
         }
 
 
 class EnergyPriceSensor(SlovenianElectricityCostsSensorBase):
     """Sensor for current energy price component."""
 
-    def __init__(self, coordinator, config_entry: ConfigEntry) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator, config_entry)
-        self._attr_unique_id = f"{config_entry.entry_id}_electricity_current_energy_price"
-        self._attr_name = "Electricity Current Energy Price"
-        self._attr_icon = "mdi:lightning-bolt-circle"
-        self._attr_native_unit_of_measurement = f"{CURRENCY_EURO}/kWh"
-        self._attr_device_class = SensorDeviceClass.MONETARY
-        self._attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_name = "Electricity Current Energy Price"
+    _attr_icon = "mdi:lightning-bolt-circle"
+    _attr_native_unit_of_measurement = _UNIT_EUR_PER_KWH
+    _attr_device_class = SensorDeviceClass.MONETARY
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _UID_SUFFIX = "_electricity_current_energy_price"
 
     @property
     def native_value(self) -> float | None:
         """Return the current energy price."""
-        if self.coordinator.data is None:
-            return None
-        return round(self.coordinator.data.get("energy_price", 0), 6)
+        return self.coordinator.data["energy_price_rounded"]
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def _build_attrs(self, data: dict[str, Any]) -> dict[str, Any]:
         """Return extra state attributes."""
-        if self.coordinator.data is None:
-            return {}
-        
-        energy_tariff = self.coordinator.data.get("energy_tariff", "MT")
         return {
-            "energy_tariff": energy_tariff,
-            "tariff_description": ENERGY_DESCRIPTIONS.get(energy_tariff, "Unknown"),
-            "last_updated": self.coordinator.data.get("last_updated"),
+            "energy_tariff": data.get("energy_tariff", "MT"),
+            "tariff_description": data["energy_tariff_description"],
+            **self._common(data),
         }
 
 
 class NetworkPriceSensor(SlovenianElectricityCostsSensorBase):
     """Sensor for current network price component."""
 
-    def __init__(self, coordinator, config_entry: ConfigEntry) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator, config_entry)
-        self._attr_unique_id = f"{config_entry.entry_id}_electricity_current_network_price"
-        self._attr_name = "Electricity Current Network Price"
-        self._attr_icon = "mdi:transmission-tower"
-        self._attr_native_unit_of_measurement = f"{CURRENCY_EURO}/kWh"
-        self._attr_device_class = SensorDeviceClass.MONETARY
-        self._attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_name = "Electricity Current Network Price"
+    _attr_icon = "mdi:transmission-tower"
+    _attr_native_unit_of_measurement = _UNIT_EUR_PER_KWH
+    _attr_device_class = SensorDeviceClass.MONETARY
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _UID_SUFFIX = "_electricity_current_network_price"
 
     @property
     def native_value(self) -> float | None:
         """Return the current network price."""
-        if self.coordinator.data is None:
-            return None
-        return round(self.coordinator.data.get("network_price", 0), 6)
+        return self.coordinator.data["network_price_rounded"]
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def _build_attrs(self, data: dict[str, Any]) -> dict[str, Any]:
         """Return extra state attributes."""
-        if self.coordinator.data is None:
-            return {}
-        
-        current_block = self.coordinator.data.get("current_block")
         return {
-            "current_block": current_block,
-            "block_description": BLOCK_DESCRIPTIONS.get(current_block, "Unknown"),
-            "last_updated": self.coordinator.data.get("last_updated"),
+            "current_block": data.get("current_block"),
+            "block_description": data["block_description"],
+            **self._common(data),
         }
 
 
 class ContributionsPriceSensor(SlovenianElectricityCostsSensorBase):
     """Sensor for contributions price component."""
 
-    def __init__(self, coordinator, config_entry: ConfigEntry) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator, config_entry)
-        self._attr_unique_id = f"{config_entry.entry_id}_electricity_contributions"
-        self._attr_name = "Electricity Contributions"
-        self._attr_icon = "mdi:hand-heart"
-        self._attr_native_unit_of_measurement = f"{CURRENCY_EURO}/kWh"
-        self._attr_device_class = SensorDeviceClass.MONETARY
-        self._attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_name = "Electricity Contributions"
+    _attr_icon = "mdi:hand-heart"
+    _attr_native_unit_of_measurement = _UNIT_EUR_PER_KWH
+    _attr_device_class = SensorDeviceClass.MONETARY
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _UID_SUFFIX = "_electricity_contributions"
 
     @property
     def native_value(self) -> float | None:
         """Return the contributions price."""
-        if self.coordinator.data is None:
-            return None
-        return round(self.coordinator.data.get("contributions", 0), 6)
+        return self.coordinator.data["contributions_rounded"]
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def _build_attrs(self, data: dict[str, Any]) -> dict[str, Any]:
         """Return extra state attributes."""
-        if self.coordinator.data is None:
-            return {}
-        
         return {
             "description": "Contributions (RES, OVES, etc.)",
-            "last_updated": self.coordinator.data.get("last_updated"),
+            **self._common(data),
         }
 
 
 class ExciseTaxSensor(SlovenianElectricityCostsSensorBase):
     """Sensor for excise tax component."""
 
-    def __init__(self, coordinator, config_entry: ConfigEntry) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator, config_entry)
-        self._attr_unique_id = f"{config_entry.entry_id}_electricity_excise_tax"
-        self._attr_name = "Electricity Excise Tax"
-        self._attr_icon = "mdi:receipt"
-        self._attr_native_unit_of_measurement = f"{CURRENCY_EURO}/kWh"
-        self._attr_device_class = SensorDeviceClass.MONETARY
-        self._attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_name = "Electricity Excise Tax"
+    _attr_icon = "mdi:receipt"
+    _attr_native_unit_of_measurement = _UNIT_EUR_PER_KWH
+    _attr_device_class = SensorDeviceClass.MONETARY
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _UID_SUFFIX = "_electricity_excise_tax"
 
     @property
     def native_value(self) -> float | None:
         """Return the excise tax."""
-        if self.coordinator.data is None:
-            return None
-        return round(self.coordinator.data.get("excise_tax", 0), 6)
+        return self.coordinator.data["excise_tax_rounded"]
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def _build_attrs(self, data: dict[str, Any]) -> dict[str, Any]:
         """Return extra state attributes."""
-        if self.coordinator.data is None:
-            return {}
-        
         return {
             "description": "Excise tax (Trošarina)",
-            "last_updated": self.coordinator.data.get("last_updated"),
+            **self._common(data),
         }
-
-
-# Alias for NetworkBlockPriceSensor to maintain compatibility
-NetworkBlockPriceSensor = TariffBlockPriceSensor
\ No newline at end of file